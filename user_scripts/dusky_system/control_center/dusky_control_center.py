@@ -18,6 +18,7 @@ Validated Production Improvements:
 
 from __future__ import annotations
 
+import functools
 import gc
 import logging
 import subprocess
@@ -91,11 +92,18 @@ import gi
 
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
-from gi.repository import Adw, Gdk, Gio, GLib, Gtk, Pango
+from gi.repository import Adw, Gdk, Gio, GLib, GObject, Gtk
 
 import lib.rows as rows
 
 
+@functools.lru_cache(maxsize=1024)
+def _escape_markup(text: str) -> str:
+    """Memoized GLib.markup_escape_text — the same titles and descriptions
+    recur across page builds and search renders, so escape each once."""
+    return GLib.markup_escape_text(text)
+
+
 # =============================================================================
 # CONSTANTS
 # =============================================================================
@@ -118,6 +126,13 @@ SEARCH_PAGE_ID: Final[str] = "search-results"
 ERROR_PAGE_ID: Final[str] = "error-state"
 EMPTY_PAGE_ID: Final[str] = "empty-state"
 
+# Rendering
+# Appended to the stylesheet when GTK runs on its CPU fallback renderer,
+# where Adwaita's rounded corners, shadows, and transitions repaint slowly.
+SOFTWARE_RENDERER_CSS: Final[str] = (
+    "\n* { border-radius: 0; box-shadow: none; transition: none; }\n"
+)
+
 # Behavior
 SEARCH_DEBOUNCE_MS: Final[int] = 200
 SEARCH_MAX_RESULTS: Final[int] = 50
@@ -260,6 +275,71 @@ class SearchHit:
     unique_id: str
 
 
+_SIDEBAR_ROW_UI: Final[str] = """\
+<interface>
+  <template class="DuskySidebarRow" parent="GtkListBoxRow">
+    <style><class name="sidebar-row"/></style>
+    <child>
+      <object class="GtkBox">
+        <child>
+          <object class="GtkImage" id="icon_image">
+            <style><class name="sidebar-row-icon"/></style>
+          </object>
+        </child>
+        <child>
+          <object class="GtkLabel" id="title_label">
+            <property name="xalign">0</property>
+            <property name="hexpand">true</property>
+            <property name="ellipsize">end</property>
+            <style><class name="sidebar-row-label"/></style>
+          </object>
+        </child>
+      </object>
+    </child>
+  </template>
+</interface>
+"""
+
+
+@Gtk.Template(string=_SIDEBAR_ROW_UI)
+class SidebarRow(Gtk.ListBoxRow):
+    """
+    Sidebar navigation row instantiated from a template parsed once at
+    import; per-row construction skips the Python-side widget assembly
+    and repeated CSS-class insertion of building the tree by hand.
+    """
+
+    __gtype_name__ = "DuskySidebarRow"
+
+    icon_image: Gtk.Image = Gtk.Template.Child()
+    title_label: Gtk.Label = Gtk.Template.Child()
+
+
+class SearchResultItem(GObject.Object):
+    """
+    List-model entry for the search results view.
+
+    Wraps either a SearchHit or a non-activatable placeholder message
+    (overflow notice, empty-result notice) so both can live in the same
+    Gio.ListStore.
+    """
+
+    __gtype_name__ = "DuskySearchResultItem"
+
+    def __init__(
+        self,
+        hit: SearchHit | None = None,
+        title: str = "",
+        subtitle: str = "",
+        dimmed: bool = False,
+    ) -> None:
+        super().__init__()
+        self.hit = hit
+        self.title = hit.title if hit else title
+        self.subtitle = hit.description if hit else subtitle
+        self.dimmed = dimmed
+
+
 @dataclass(slots=True)
 class ApplicationState:
     """
@@ -295,8 +375,20 @@ class DuskyControlCenter(Adw.Application):
         self._window: Adw.Window | None = None
         self._reload_running = False
         self._reload_queued = False
+        self._css_file_cache: tuple[int, int, str] | None = None
         self._directory_generator_cache: dict[int, tuple[ConfigItem, ...]] = {}
         self._file_generator_cache: dict[int, tuple[ConfigItem, ...]] = {}
+        self._search_index: list[tuple[str, SearchHit]] | None = None
+        self._search_gram_map: dict[str, tuple[int, ...]] | None = None
+        self._last_query = ""
+        self._last_match_indices: tuple[int, ...] | None = None
+        self._pending_page_builds: dict[int, ConfigPage] = {}
+        self._page_build_source_id = 0
+        self._pages: list[ConfigPage] = []
+        self._page_titles: list[str] = []
+        self._page_idx_by_id: dict[str, int] = {}
+        self._gicon_cache: dict[str, Gio.Icon] = {}
+        self._page_widgets: dict[int, tuple[Adw.NavigationView, str]] = {}
 
     def _init_widget_refs(self) -> None:
         """Initialize or reset all widget references to None."""
@@ -307,7 +399,8 @@ class DuskyControlCenter(Adw.Application):
         self._search_entry: Gtk.SearchEntry | None = None
         self._search_btn: Gtk.ToggleButton | None = None
         self._search_page: Adw.NavigationPage | None = None
-        self._search_results_group: Adw.PreferencesGroup | None = None
+        self._search_store: Gio.ListStore | None = None
+        self._search_results_title: Gtk.Label | None = None
         self._split_view: Adw.OverlaySplitView | None = None
 
     # ─────────────────────────────────────────────────────────────────────────
@@ -379,12 +472,30 @@ class DuskyControlCenter(Adw.Application):
         """
         Synchronous load for initial startup.
 
+        Config parsing and validation run on a worker thread while this
+        thread reads the stylesheet, overlapping the two independent disk
+        reads; the join below keeps the overall call synchronous.
+
         Returns:
             ConfigLoadResult with config, css, success status, and any error message.
         """
-        config, config_error = self._do_load_config()
+        config_result: tuple[AppConfig, str | None] = ({"pages": []}, None)
+
+        def load_config_worker() -> None:
+            nonlocal config_result
+            config_result = self._do_load_config()
+            # Warm the per-key settings cache on the same worker so toggle
+            # rows don't each pay a file read during page construction.
+            utility.preload_settings()
+
+        config_thread = threading.Thread(target=load_config_worker, daemon=True)
+        config_thread.start()
+
         css = self._do_load_css()
 
+        config_thread.join()
+        config, config_error = config_result
+
         return {
             "success": config_error is None,
             "config": config,
@@ -483,7 +594,13 @@ class DuskyControlCenter(Adw.Application):
         """
         css_path = SCRIPT_DIR / CSS_FILENAME
         try:
-            return css_path.read_text(encoding="utf-8")
+            st = css_path.stat()
+            cached = self._css_file_cache
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                return cached[2]
+            content = css_path.read_text(encoding="utf-8")
+            self._css_file_cache = (st.st_mtime_ns, st.st_size, content)
+            return content
         except FileNotFoundError:
             log.info("No custom CSS file found at: %s", css_path)
             return ""
@@ -494,9 +611,18 @@ class DuskyControlCenter(Adw.Application):
             log.warning("Failed to read CSS file: %s", e)
             return ""
 
+    @staticmethod
+    def _using_software_renderer() -> bool:
+        """Return True when GTK was forced onto a CPU renderer via GSK_RENDERER."""
+        return os.environ.get("GSK_RENDERER", "").lower() in ("cairo", "software")
+
     def _apply_css(self) -> None:
         """Apply loaded CSS without discarding the last working provider on parse failure."""
-        if not self._state.css_content:
+        css = self._state.css_content
+        if self._using_software_renderer():
+            css += SOFTWARE_RENDERER_CSS
+
+        if not css:
             self._remove_css_provider()
             self._display = Gdk.Display.get_default()
             return
@@ -508,7 +634,7 @@ class DuskyControlCenter(Adw.Application):
 
         provider = Gtk.CssProvider()
         try:
-            provider.load_from_string(self._state.css_content)
+            provider.load_from_string(css)
         except GLib.Error as e:
             log.error("CSS parsing failed: %s", e.message)
             return
@@ -543,6 +669,7 @@ class DuskyControlCenter(Adw.Application):
         return {
             "stack": self._stack,
             "config": self._state.config,
+            "page_idx_by_id": self._page_idx_by_id,
             "sidebar": self._sidebar_list,
             "toast_overlay": self._toast_overlay,
             "nav_view": nav_view,
@@ -753,12 +880,22 @@ class DuskyControlCenter(Adw.Application):
         Clear existing UI elements and rebuild from current config.
         """
         self._cancel_debounce()
+        self._cancel_page_builds()
         self._directory_generator_cache.clear()
         self._file_generator_cache.clear()
+        self._search_index = None
+        self._search_gram_map = None
+        self._last_query = ""
+        self._last_match_indices = None
+        self._pages = []
+        self._page_titles = []
+        self._page_idx_by_id = {}
+        self._page_widgets.clear()
         self._state.last_visible_page = None
 
         self._search_page = None
-        self._search_results_group = None
+        self._search_store = None
+        self._search_results_title = None
 
         self._clear_sidebar()
         self._clear_stack()
@@ -829,11 +966,40 @@ class DuskyControlCenter(Adw.Application):
         header.pack_start(self._create_sidebar_toggle_button())
         toolbar.add_top_bar(header)
 
-        pref_page = Adw.PreferencesPage()
-        self._search_results_group = Adw.PreferencesGroup(title="Search Results")
-        pref_page.add(self._search_results_group)
+        self._search_results_title = Gtk.Label(
+            label="Search Results",
+            xalign=0,
+            margin_top=12,
+            margin_bottom=6,
+            margin_start=18,
+            margin_end=18,
+        )
+        self._search_results_title.add_css_class("heading")
+
+        # A ListView only realizes the rows currently on screen, so large
+        # result sets stay cheap regardless of how many entries match.
+        self._search_store = Gio.ListStore.new(SearchResultItem)
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_result_setup)
+        factory.connect("bind", self._on_result_bind)
+
+        list_view = Gtk.ListView(
+            model=Gtk.NoSelection.new(self._search_store),
+            factory=factory,
+            single_click_activate=True,
+            vexpand=True,
+        )
+        list_view.connect("activate", self._on_result_activated)
 
-        toolbar.set_content(pref_page)
+        scrolled = Gtk.ScrolledWindow(vexpand=True)
+        scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+        scrolled.set_child(list_view)
+
+        content = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+        content.append(self._search_results_title)
+        content.append(scrolled)
+
+        toolbar.set_content(content)
         self._search_page.set_child(toolbar)
 
         self._stack.add_named(self._search_page, SEARCH_PAGE_ID)
@@ -895,7 +1061,7 @@ class DuskyControlCenter(Adw.Application):
         """
         self._state.debounce_source_id = 0
 
-        if self._stack is None or self._search_results_group is None:
+        if self._stack is None or self._search_store is None:
             return GLib.SOURCE_REMOVE
 
         display_query = query.strip()
@@ -917,63 +1083,130 @@ class DuskyControlCenter(Adw.Application):
         return GLib.SOURCE_REMOVE
 
     def _reset_search_results(self, title: str) -> None:
-        """Reset the search results group with a new title."""
-        if self._search_page is None:
-            return
+        """Retitle the results view and drop the previous result items."""
+        if self._search_store is not None:
+            self._search_store.remove_all()
+        if self._search_results_title is not None:
+            self._search_results_title.set_label(title)
 
-        toolbar = self._search_page.get_child()
-        if not isinstance(toolbar, Adw.ToolbarView):
+    def _build_search_index(self) -> list[tuple[str, SearchHit]]:
+        """
+        Flatten the config into (casefolded haystack, SearchHit) tuples so
+        per-keystroke searches scan a flat list instead of re-walking the
+        nested config and re-casefolding every item.
+
+        Also builds an n-gram (1-3 char) lookup table over the index. Short
+        queries are the widest (and therefore slowest) result sets; mapping
+        every short substring to its entry indices up front turns those
+        keystrokes into a single dict lookup with identical match semantics.
+        """
+        entries = list(self._iter_all_entries())
+
+        grams: dict[str, set[int]] = {}
+        for idx, (haystack, _hit) in enumerate(entries):
+            for text in haystack.split("\x1f"):
+                length = len(text)
+                for size in (1, 2, 3):
+                    for start in range(length - size + 1):
+                        grams.setdefault(text[start:start + size], set()).add(idx)
+
+        self._search_gram_map = {gram: tuple(sorted(ids)) for gram, ids in grams.items()}
+        return entries
+
+    def _iter_matching_hits(self, query: str) -> Iterator[SearchHit]:
+        """
+        Yield hits matching the casefolded query from the flat index.
+
+        Since every match for "themes" is also a match for "theme", a query
+        that extends the previously completed one only rescans the previous
+        result set instead of the whole index. The narrowed candidate list is
+        cached only when a scan ran to completion, so an early consumer break
+        (result cap reached) can never hide later matches.
+        """
+        if self._search_index is None:
+            self._search_index = self._build_search_index()
+
+        tokens = query.split()
+        if not tokens:
             return
 
-        page = toolbar.get_content()
-        if not isinstance(page, Adw.PreferencesPage):
+        if len(tokens) == 1 and len(query) <= 3 and self._search_gram_map is not None:
+            grams = self._search_gram_map.get(query, ())
+            for idx in grams:
+                yield self._search_index[idx][1]
+            self._last_query = query
+            self._last_match_indices = tuple(grams)
             return
 
-        if self._search_results_group is not None:
-            page.remove(self._search_results_group)
+        candidates: tuple[int, ...] | list[int] | range
+        if (
+            self._last_match_indices is not None
+            and self._last_query
+            and query.startswith(self._last_query)
+        ):
+            candidates = self._last_match_indices
+        else:
+            candidates = range(len(self._search_index))
+            if self._search_gram_map is not None:
+                # Any short token pre-narrows candidates to its gram set;
+                # multi-token queries intersect them before verification.
+                gram_sets = [
+                    set(self._search_gram_map.get(token, ()))
+                    for token in tokens
+                    if len(token) <= 3
+                ]
+                if gram_sets:
+                    candidates = sorted(set.intersection(*gram_sets))
+
+        matched: list[int] = []
+        if len(tokens) == 1:
+            token = tokens[0]
+            for idx in candidates:
+                haystack, hit = self._search_index[idx]
+                if token in haystack:
+                    matched.append(idx)
+                    yield hit
+        else:
+            for idx in candidates:
+                haystack, hit = self._search_index[idx]
+                if all(token in haystack for token in tokens):
+                    matched.append(idx)
+                    yield hit
 
-        self._search_results_group = Adw.PreferencesGroup(title=GLib.markup_escape_text(title))
-        page.add(self._search_results_group)
+        self._last_query = query
+        self._last_match_indices = tuple(matched)
 
     def _populate_search_results(self, query: str) -> None:
-        """Populate search results, limited to prevent UI freeze."""
-        if self._search_results_group is None:
+        """Populate the result store, limited to keep overflow sets readable."""
+        if self._search_store is None:
             return
 
-        count = 0
+        items: list[SearchResultItem] = []
 
-        for hit in self._iter_matching_items(query):
-            if count >= SEARCH_MAX_RESULTS:
-                overflow_row = Adw.ActionRow(
+        for hit in self._iter_matching_hits(query):
+            if len(items) >= SEARCH_MAX_RESULTS:
+                items.append(SearchResultItem(
                     title=f"Showing first {SEARCH_MAX_RESULTS} results...",
                     subtitle="Refine your search for more specific results",
-                )
-                overflow_row.set_activatable(False)
-                overflow_row.add_css_class("dim-label")
-                self._search_results_group.add(overflow_row)
+                    dimmed=True,
+                ))
                 break
+            items.append(SearchResultItem(hit))
 
-            self._search_results_group.add(self._build_search_result_row(hit))
-            count += 1
-
-        if count == 0:
-            no_results = Adw.ActionRow(
+        if not items:
+            items.append(SearchResultItem(
                 title="No results found",
                 subtitle="Try different search terms",
-            )
-            no_results.set_activatable(False)
-            self._search_results_group.add(no_results)
+            ))
 
-    def _build_search_result_row(self, hit: SearchHit) -> Adw.ActionRow:
-        """Build a clickable row that navigates to the matched item's location."""
-        row = Adw.ActionRow(
-            title=GLib.markup_escape_text(hit.title),
-            subtitle=GLib.markup_escape_text(hit.description)
-        )
+        self._search_store.splice(0, self._search_store.get_n_items(), items)
+
+    def _on_result_setup(self, _factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem) -> None:
+        """Build the reusable row widget for a list item slot."""
+        row = Adw.ActionRow()
         row.add_css_class("action-row")
-        row.set_activatable(True)
 
-        icon_widget = Gtk.Image.new_from_icon_name(hit.icon_name)
+        icon_widget = Gtk.Image()
         icon_widget.add_css_class("action-row-prefix-icon")
         row.add_prefix(icon_widget)
 
@@ -981,8 +1214,39 @@ class DuskyControlCenter(Adw.Application):
         go_icon.set_valign(Gtk.Align.CENTER)
         row.add_suffix(go_icon)
 
-        row.connect("activated", lambda _row, h=hit: self._navigate_from_search(h))
-        return row
+        row._result_prefix_icon = icon_widget
+        row._result_suffix_icon = go_icon
+        list_item.set_child(row)
+
+    def _on_result_bind(self, _factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem) -> None:
+        """Bind a recycled row widget to the item scrolled into view."""
+        item = list_item.get_item()
+        row = list_item.get_child()
+        if not isinstance(item, SearchResultItem) or not isinstance(row, Adw.ActionRow):
+            return
+
+        row.set_title(item.title)
+        row.set_subtitle(item.subtitle)
+
+        is_hit = item.hit is not None
+        list_item.set_activatable(is_hit)
+        row._result_prefix_icon.set_visible(is_hit)
+        row._result_suffix_icon.set_visible(is_hit)
+        if is_hit:
+            row._result_prefix_icon.set_from_gicon(self._get_gicon(item.hit.icon_name))
+
+        if item.dimmed:
+            row.add_css_class("dim-label")
+        else:
+            row.remove_css_class("dim-label")
+
+    def _on_result_activated(self, _list_view: Gtk.ListView, position: int) -> None:
+        """Navigate to the activated search result."""
+        if self._search_store is None:
+            return
+        item = self._search_store.get_item(position)
+        if isinstance(item, SearchResultItem) and item.hit is not None:
+            self._navigate_from_search(item.hit)
 
     def _navigate_from_search(self, hit: SearchHit) -> None:
         """Navigate from a search result to its actual location."""
@@ -997,19 +1261,19 @@ class DuskyControlCenter(Adw.Application):
 
         self._sidebar_list.select_row(row)
 
-        page_name = f"{PAGE_PREFIX}{hit.page_idx}"
-        root_tag = f"root_{hit.page_idx}"
-        self._switch_to_page_and_reset(page_name, root_tag)
+        self._ensure_page_built(hit.page_idx)
+        self._switch_to_page_and_reset(hit.page_idx)
 
         target_page = None
+        entry = self._page_widgets.get(hit.page_idx)
 
-        if self._stack:
-            child = self._stack.get_child_by_name(page_name)
+        if self._stack and entry is not None:
+            child = entry[0]
             if isinstance(child, Adw.NavigationView):
                 target_page = child.get_visible_page()
 
                 if len(hit.nav_path) > 1:
-                    current_layout = self._state.config.get("pages", [])[hit.page_idx].get("layout", [])
+                    current_layout = self._pages[hit.page_idx].get("layout", [])
                     current_path = [hit.nav_path[0]]
 
                     for depth in range(1, len(hit.nav_path)):
@@ -1069,15 +1333,12 @@ class DuskyControlCenter(Adw.Application):
 
         return ICON_DEFAULT
 
-    def _iter_matching_items(self, query: str) -> Iterator[SearchHit]:
+    def _iter_all_entries(self) -> Iterator[tuple[str, SearchHit]]:
         """
-        Iterate through all config items matching the query.
-        Yields SearchHit objects with page and navigation path metadata.
+        Iterate every searchable config item, yielding index entries with
+        page and navigation path metadata.
         """
-        if not query:
-            return
-
-        for page_idx, page in enumerate(self._state.config.get("pages", [])):
+        for page_idx, page in enumerate(self._pages):
             if not isinstance(page, dict):
                 continue
 
@@ -1085,22 +1346,20 @@ class DuskyControlCenter(Adw.Application):
             layout = page.get("layout", [])
 
             if isinstance(layout, list):
-                yield from self._iter_layout_hits(
+                yield from self._iter_layout_entries(
                     layout,
-                    query,
                     page_title,
                     page_idx,
                     (page_title,),
                 )
 
-    def _iter_layout_hits(
+    def _iter_layout_entries(
         self,
         layout: list[ConfigSection],
-        query: str,
         breadcrumb: str,
         page_idx: int,
         nav_path: tuple[str, ...],
-    ) -> Iterator[SearchHit]:
+    ) -> Iterator[tuple[str, SearchHit]]:
         for section in layout:
             if not isinstance(section, dict):
                 continue
@@ -1108,18 +1367,17 @@ class DuskyControlCenter(Adw.Application):
             items = section.get("items")
             if isinstance(items, list):
                 for item in items:
-                    yield from self._iter_item_hits(item, query, breadcrumb, page_idx, nav_path)
+                    yield from self._iter_item_entries(item, breadcrumb, page_idx, nav_path)
             else:
-                yield from self._iter_item_hits(section, query, breadcrumb, page_idx, nav_path)
+                yield from self._iter_item_entries(section, breadcrumb, page_idx, nav_path)
 
-    def _iter_item_hits(
+    def _iter_item_entries(
         self,
         item: Any,
-        query: str,
         breadcrumb: str,
         page_idx: int,
         nav_path: tuple[str, ...],
-    ) -> Iterator[SearchHit]:
+    ) -> Iterator[tuple[str, SearchHit]]:
         if not isinstance(item, dict):
             return
 
@@ -1130,12 +1388,12 @@ class DuskyControlCenter(Adw.Application):
 
         if item_type == ItemType.DIRECTORY_GENERATOR:
             for gen_item in self._process_directory_generator(item):
-                yield from self._iter_item_hits(gen_item, query, breadcrumb, page_idx, nav_path)
+                yield from self._iter_item_entries(gen_item, breadcrumb, page_idx, nav_path)
             return
 
         if item_type == ItemType.FILE_GENERATOR:
             for gen_item in self._process_file_generator(item):
-                yield from self._iter_item_hits(gen_item, query, breadcrumb, page_idx, nav_path)
+                yield from self._iter_item_entries(gen_item, breadcrumb, page_idx, nav_path)
             return
 
         title = str(props.get("title", "")).strip()
@@ -1143,24 +1401,28 @@ class DuskyControlCenter(Adw.Application):
 
         unique_id = self._generate_widget_id(item)
 
-        if query in title.casefold() or query in desc.casefold():
-            yield SearchHit(
-                title=title or "Unnamed",
-                description=f"{breadcrumb} • {desc}" if desc else breadcrumb,
-                icon_name=self._extract_icon_name(props),
-                page_idx=page_idx,
-                nav_path=nav_path,
-                unique_id=unique_id,
-            )
+        # Display fields are escaped once here; binds paste them into the
+        # row's markup-interpreting title/subtitle without further work.
+        hit = SearchHit(
+            title=_escape_markup(title or "Unnamed"),
+            description=_escape_markup(f"{breadcrumb} • {desc}" if desc else breadcrumb),
+            icon_name=self._extract_icon_name(props),
+            page_idx=page_idx,
+            nav_path=nav_path,
+            unique_id=unique_id,
+        )
+        # Fuse both searchable fields into one haystack, separated by a
+        # control character no query can contain, so each keystroke does a
+        # single substring scan per entry instead of two.
+        yield (f"{title}\x1f{desc}".casefold(), hit)
 
         if item_type == ItemType.NAVIGATION:
             sub_title = title or "Submenu"
             sub_layout = item.get("layout")
             if isinstance(sub_layout, list):
                 next_path = (*nav_path, sub_title)
-                yield from self._iter_layout_hits(
+                yield from self._iter_layout_entries(
                     sub_layout,
-                    query,
                     f"{breadcrumb} › {sub_title}",
                     page_idx,
                     next_path,
@@ -1172,9 +1434,8 @@ class DuskyControlCenter(Adw.Application):
             if isinstance(sub_items, list):
                 next_breadcrumb = f"{breadcrumb} › {sub_title}"
                 for child in sub_items:
-                    yield from self._iter_item_hits(
+                    yield from self._iter_item_entries(
                         child,
-                        query,
                         next_breadcrumb,
                         page_idx,
                         nav_path,
@@ -1240,24 +1501,28 @@ class DuskyControlCenter(Adw.Application):
             return
 
         idx = row.get_index()
-        pages = self._state.config.get("pages", [])
-        if 0 <= idx < len(pages):
-            page_name = f"{PAGE_PREFIX}{idx}"
-            root_tag = f"root_{idx}"
-            self._switch_to_page_and_reset(page_name, root_tag)
+        if 0 <= idx < len(self._pages):
+            self._ensure_page_built(idx)
+            self._switch_to_page_and_reset(idx)
 
     def _on_row_activated(self, listbox: Gtk.ListBox, row: Gtk.ListBoxRow) -> None:
         """Handle sidebar row activation (clicking already selected row)."""
         self._on_row_selected(listbox, row)
 
-    def _switch_to_page_and_reset(self, page_name: str, root_tag: str) -> None:
-        """Switch to the page and pop navigation to root."""
-        if self._stack:
-            if child := self._stack.get_child_by_name(page_name):
-                if isinstance(child, Adw.NavigationView):
-                    child.pop_to_tag(root_tag)
+    def _switch_to_page_and_reset(self, idx: int) -> None:
+        """
+        Switch to the page and pop navigation to root.
+
+        Uses the widget recorded at build time, skipping the ViewStack's
+        name-to-child lookup and the f-string name allocation per click.
+        """
+        entry = self._page_widgets.get(idx)
+        if entry is None or self._stack is None:
+            return
 
-            self._stack.set_visible_child_name(page_name)
+        nav, root_tag = entry
+        nav.pop_to_tag(root_tag)
+        self._stack.set_visible_child(nav)
 
     # ─────────────────────────────────────────────────────────────────────────
     # PAGE BUILDING
@@ -1265,19 +1530,31 @@ class DuskyControlCenter(Adw.Application):
     def _populate_pages(self, select_index: int | None = None) -> None:
         """
         Create sidebar rows and content pages from config.
+
+        Only the initially selected page is built synchronously; the rest
+        stream in one per main-loop idle tick so the window can be presented
+        without waiting for every row of every page to be realized. Selecting
+        a page that has not streamed in yet builds it on demand.
         """
         pages = self._state.config.get("pages", [])
         if not pages:
             self._show_empty_state()
             return
 
+        self._pages = pages
+        self._page_titles = [str(page.get("title", "Untitled")) for page in pages]
+        self._page_idx_by_id = {
+            str(page_id): idx
+            for idx, page in enumerate(pages)
+            if (page_id := page.get("id"))
+        }
+
         first_row: Gtk.ListBoxRow | None = None
         target_row: Gtk.ListBoxRow | None = None
 
         for idx, page in enumerate(pages):
-            title = str(page.get("title", "Untitled"))
+            title = self._page_titles[idx]
             icon = str(page.get("icon", ICON_DEFAULT))
-            root_tag = f"root_{idx}"
 
             row = self._create_sidebar_row(title, icon)
 
@@ -1288,44 +1565,85 @@ class DuskyControlCenter(Adw.Application):
                 if idx == select_index:
                     target_row = row
 
-            nav = Adw.NavigationView()
-
-            ctx = self._get_context(
-                nav_view=nav,
-                builder_func=self._build_nav_page,
-                path=[title],
-            )
+            self._pending_page_builds[idx] = page
 
-            root = self._build_nav_page(title, page.get("layout", []), ctx, root_tag=root_tag)
-            nav.add(root)
+        initial_idx = select_index if target_row is not None else 0
+        self._ensure_page_built(initial_idx)
 
-            if self._stack:
-                self._stack.add_named(nav, f"{PAGE_PREFIX}{idx}")
+        if self._pending_page_builds:
+            self._page_build_source_id = GLib.idle_add(self._build_next_pending_page)
 
         if self._sidebar_list:
             row_to_select = target_row or first_row
             if row_to_select:
                 self._sidebar_list.select_row(row_to_select)
 
-    def _create_sidebar_row(self, title: str, icon_name: str) -> Gtk.ListBoxRow:
-        """Create a styled sidebar navigation row."""
-        row = Gtk.ListBoxRow(css_classes=["sidebar-row"])
-        box = Gtk.Box()
-        icon = Gtk.Image.new_from_icon_name(icon_name)
-        icon.add_css_class("sidebar-row-icon")
-        
-        label = Gtk.Label(
-            label=title,
-            xalign=0,
-            hexpand=True,
-            css_classes=["sidebar-row-label"],
+    def _build_content_page(self, idx: int, page: ConfigPage) -> None:
+        """Build one page's navigation view and add it to the content stack."""
+        title = str(page.get("title", "Untitled"))
+        root_tag = f"root_{idx}"
+
+        nav = Adw.NavigationView()
+
+        ctx = self._get_context(
+            nav_view=nav,
+            builder_func=self._build_nav_page,
+            path=[title],
         )
-        label.set_ellipsize(Pango.EllipsizeMode.END)
-        
-        box.append(icon)
-        box.append(label)
-        row.set_child(box)
 
+        root = self._build_nav_page(title, page.get("layout", []), ctx, root_tag=root_tag)
+        nav.add(root)
+
+        if self._stack:
+            self._stack.add_named(nav, f"{PAGE_PREFIX}{idx}")
+            self._page_widgets[idx] = (nav, root_tag)
+
+    def _ensure_page_built(self, idx: int | None) -> None:
+        """Build the given page immediately if it is still pending."""
+        if idx is None:
+            return
+        page = self._pending_page_builds.pop(idx, None)
+        if page is not None:
+            self._build_content_page(idx, page)
+
+    def _build_next_pending_page(self) -> bool:
+        """Idle callback: stream in one pending page per main-loop tick."""
+        if not self._pending_page_builds:
+            self._page_build_source_id = 0
+            return GLib.SOURCE_REMOVE
+
+        idx = next(iter(self._pending_page_builds))
+        self._build_content_page(idx, self._pending_page_builds.pop(idx))
+
+        if self._pending_page_builds:
+            return GLib.SOURCE_CONTINUE
+        self._page_build_source_id = 0
+        return GLib.SOURCE_REMOVE
+
+    def _cancel_page_builds(self) -> None:
+        """Drop any pages still queued for idle construction."""
+        if self._page_build_source_id > 0:
+            GLib.source_remove(self._page_build_source_id)
+            self._page_build_source_id = 0
+        self._pending_page_builds.clear()
+
+    def _get_gicon(self, icon_name: str) -> Gio.Icon:
+        """
+        Return a shared Gio.ThemedIcon for the name. Configs reuse the same
+        handful of icon names across many rows; sharing one GIcon per name
+        skips a theme lookup per widget.
+        """
+        icon = self._gicon_cache.get(icon_name)
+        if icon is None:
+            icon = Gio.ThemedIcon.new(icon_name)
+            self._gicon_cache[icon_name] = icon
+        return icon
+
+    def _create_sidebar_row(self, title: str, icon_name: str) -> Gtk.ListBoxRow:
+        """Create a styled sidebar navigation row from the shared template."""
+        row = SidebarRow()
+        row.icon_image.set_from_gicon(self._get_gicon(icon_name))
+        row.title_label.set_label(title)
         return row
 
     def _make_nav_tag(self, path: list[str] | tuple[str, ...]) -> str:
@@ -1407,7 +1725,7 @@ class DuskyControlCenter(Adw.Application):
             props = {}
 
         if title := props.get("title"):
-            group.set_title(GLib.markup_escape_text(str(title)))
+            group.set_title(_escape_markup(str(title)))
 
         flow = Gtk.FlowBox()
         flow.set_valign(Gtk.Align.START)
@@ -1466,9 +1784,9 @@ class DuskyControlCenter(Adw.Application):
         props = section.get("properties", {})
 
         if title := props.get("title"):
-            group.set_title(GLib.markup_escape_text(str(title)))
+            group.set_title(_escape_markup(str(title)))
         if desc := props.get("description"):
-            group.set_description(GLib.markup_escape_text(str(desc)))
+            group.set_description(_escape_markup(str(desc)))
 
         for item in section.get("items", []):
             if item.get("type") == ItemType.DIRECTORY_GENERATOR:
@@ -1748,8 +2066,8 @@ class DuskyControlCenter(Adw.Application):
     def _build_error_row(self, error: str, title: str) -> Adw.ActionRow:
         """Build an error placeholder row for failed item builds."""
         row = Adw.ActionRow(
-            title=GLib.markup_escape_text(f"⚠ {title}"),
-            subtitle=GLib.markup_escape_text(f"Build error: {error[:80]}"),
+            title=_escape_markup(f"⚠ {title}"),
+            subtitle=_escape_markup(f"Build error: {error[:80]}"),
         )
         row.add_css_class("error")
         row.set_activatable(False)
@@ -1766,7 +2084,7 @@ class DuskyControlCenter(Adw.Application):
         status = Adw.StatusPage(
             icon_name=ICON_ERROR,
             title="Configuration Error",
-            description=GLib.markup_escape_text(error_message),
+            description=_escape_markup(error_message),
         )
         status.add_css_class("error-state")
 
@@ -24,6 +24,7 @@ import shlex
 import signal
 import subprocess
 import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager, suppress
 from dataclasses import dataclass, field
@@ -279,6 +280,7 @@ class RowProperties(TypedDict, total=False):
 class RowContext(TypedDict, total=False):
     stack: Adw.ViewStack | None
     config: dict[str, object]
+    page_idx_by_id: dict[str, int]
     sidebar: Gtk.ListBox | None
     toast_overlay: Adw.ToastOverlay | None
     nav_view: Adw.NavigationView | None
@@ -435,11 +437,18 @@ def _perform_redirect(
     target_page_idx = -1
     target_page_config = None
 
-    for idx, page in enumerate(pages):
-        if isinstance(page, dict) and page.get("id") == page_id:
+    idx_by_id = context.get("page_idx_by_id")
+    if idx_by_id is not None:
+        idx = idx_by_id.get(str(page_id), -1)
+        if 0 <= idx < len(pages) and isinstance(pages[idx], dict):
             target_page_idx = idx
-            target_page_config = page
-            break
+            target_page_config = pages[idx]
+    else:
+        for idx, page in enumerate(pages):
+            if isinstance(page, dict) and page.get("id") == page_id:
+                target_page_idx = idx
+                target_page_config = page
+                break
 
     if target_page_idx == -1 or not target_page_config:
         return
@@ -539,6 +548,33 @@ def _expand_path(path: str) -> Path:
     return Path(path).expanduser()
 
 
+# Value lookups run on executor threads; both caches are lock-guarded.
+# Exec output is reused within a short TTL so several labels sharing one
+# command (or a label re-entered during navigation/search) fork once; file
+# values are reused until the file's mtime or size changes.
+_VALUE_CACHE_TTL_SECONDS: Final[float] = 2.0
+_exec_value_cache: dict[str, tuple[float, str]] = {}
+_exec_value_cache_lock = threading.Lock()
+_file_value_cache: dict[Path, tuple[int, int, str]] = {}
+_file_value_cache_lock = threading.Lock()
+
+
+# Rows are built on the main thread only; a plain dict is sufficient here.
+_gicon_cache: dict[str, Gio.ThemedIcon] = {}
+
+
+def _themed_image(icon_name: str) -> Gtk.Image:
+    """
+    Create a Gtk.Image from a shared per-name GIcon. Configs reuse the same
+    few icon names across many rows, so this skips a theme lookup per widget.
+    """
+    gicon = _gicon_cache.get(icon_name)
+    if gicon is None:
+        gicon = Gio.ThemedIcon.new(icon_name)
+        _gicon_cache[icon_name] = gicon
+    return Gtk.Image.new_from_gicon(gicon)
+
+
 def _resolve_static_icon_name(icon_config: object) -> str:
     if isinstance(icon_config, str):
         return icon_config or DEFAULT_ICON
@@ -547,6 +583,31 @@ def _resolve_static_icon_name(icon_config: object) -> str:
     return DEFAULT_ICON
 
 
+@lru_cache(maxsize=1024)
+def _escape_markup(text: str) -> str:
+    """Memoized GLib.markup_escape_text — row titles and subtitles repeat
+    across page builds, so each distinct string is escaped once."""
+    return GLib.markup_escape_text(text)
+
+
+def _prefix_icon(icon: object) -> Gtk.Image:
+    """
+    Build the styled prefix-icon image for a row's leading slot. The pill
+    class is applied here once so row classes don't each repeat it.
+    """
+    if isinstance(icon, dict) and icon.get("type") == "file":
+        if path := icon.get("path"):
+            p = _expand_path(str(path))
+            if p.exists():
+                img = Gtk.Image.new_from_file(str(p))
+                img.add_css_class("action-row-prefix-icon")
+                return img
+
+    img = _themed_image(_resolve_static_icon_name(icon))
+    img.add_css_class("action-row-prefix-icon")
+    return img
+
+
 def _safe_source_remove(source_id: int) -> None:
     if source_id > 0:
         with suppress(Exception):
@@ -1082,9 +1143,9 @@ class BaseActionRow(DynamicIconMixin, HyprlandIPCMixin, Adw.ActionRow):
         self.builder_func = self.context.get("builder_func")
 
         title = str(properties.get("title", "Unnamed"))
-        self.set_title(GLib.markup_escape_text(title))
+        self.set_title(_escape_markup(title))
         if sub := properties.get("description", ""):
-            self.set_subtitle(GLib.markup_escape_text(str(sub)))
+            self.set_subtitle(_escape_markup(str(sub)))
 
         icon_config = properties.get("icon", DEFAULT_ICON)
         self.icon_widget = self._create_icon_widget(icon_config)
@@ -1096,18 +1157,7 @@ class BaseActionRow(DynamicIconMixin, HyprlandIPCMixin, Adw.ActionRow):
         self._start_hyprland_ipc()
 
     def _create_icon_widget(self, icon: object) -> Gtk.Image:
-        if isinstance(icon, dict) and icon.get("type") == "file":
-            if path := icon.get("path"):
-                p = _expand_path(str(path))
-                if p.exists():
-                    img = Gtk.Image.new_from_file(str(p))
-                    img.add_css_class("action-row-prefix-icon")
-                    img.set_valign(Gtk.Align.CENTER)
-                    return img
-
-        icon_name = _resolve_static_icon_name(icon)
-        img = Gtk.Image.new_from_icon_name(icon_name)
-        img.add_css_class("action-row-prefix-icon")
+        img = _prefix_icon(icon)
         img.set_valign(Gtk.Align.CENTER)
         return img
 
@@ -1141,7 +1191,7 @@ class ButtonRow(BaseActionRow):
             for btn_cfg in multi_buttons:
                 b = Gtk.Button()
                 if icon_name := btn_cfg.get("icon"):
-                    b.set_child(Gtk.Image.new_from_icon_name(icon_name))
+                    b.set_child(_themed_image(icon_name))
                     b.set_tooltip_text(str(btn_cfg.get("button_text", "Action")))
                 else:
                     b.set_label(str(btn_cfg.get("button_text", "Action")))
@@ -1567,10 +1617,10 @@ class MultiTextRow(DynamicIconMixin, HyprlandIPCMixin, Adw.ExpanderRow):
         self.on_action: ActionConfig = on_action or {}
         self.context: RowContext = context or {}
         
-        self.set_title(GLib.markup_escape_text(str(properties.get("title", "Text Editor"))))
+        self.set_title(_escape_markup(str(properties.get("title", "Text Editor"))))
         
         if sub := properties.get("description", ""):
-            self.set_subtitle(GLib.markup_escape_text(str(sub)))
+            self.set_subtitle(_escape_markup(str(sub)))
         
         icon = properties.get("icon", DEFAULT_ICON)
         self.icon_widget = self._create_icon_widget(icon)
@@ -1604,18 +1654,7 @@ class MultiTextRow(DynamicIconMixin, HyprlandIPCMixin, Adw.ExpanderRow):
         self._start_hyprland_ipc()
 
     def _create_icon_widget(self, icon: object) -> Gtk.Image:
-        if isinstance(icon, dict) and icon.get("type") == "file":
-            if path := icon.get("path"):
-                p = _expand_path(str(path))
-                if p.exists():
-                    img = Gtk.Image.new_from_file(str(p))
-                    img.add_css_class("action-row-prefix-icon")
-                    return img
-
-        icon_name = _resolve_static_icon_name(icon)
-        img = Gtk.Image.new_from_icon_name(icon_name)
-        img.add_css_class("action-row-prefix-icon")
-        return img
+        return _prefix_icon(icon)
 
     def _on_buffer_changed(self, buf: Gtk.TextBuffer) -> None:
         with self._state.lock:
@@ -1837,6 +1876,13 @@ class LabelRow(BaseActionRow):
                     return self._read_file(parts[1])
             except ValueError:
                 pass
+
+        now = time.monotonic()
+        with _exec_value_cache_lock:
+            cached = _exec_value_cache.get(cmd)
+            if cached is not None and now - cached[0] < _VALUE_CACHE_TTL_SECONDS:
+                return cached[1]
+
         try:
             res = subprocess.run(
                 cmd,
@@ -1845,19 +1891,34 @@ class LabelRow(BaseActionRow):
                 text=True,
                 timeout=SUBPROCESS_TIMEOUT_LONG,
             )
-            return res.stdout.strip() or LABEL_NA
+            result = res.stdout.strip() or LABEL_NA
         except subprocess.TimeoutExpired:
-            return LABEL_TIMEOUT
+            result = LABEL_TIMEOUT
         except subprocess.SubprocessError:
-            return LABEL_ERROR
+            result = LABEL_ERROR
+
+        # Timeouts and errors are cached too, so a broken command cannot
+        # stall every poll cycle back to back.
+        with _exec_value_cache_lock:
+            _exec_value_cache[cmd] = (time.monotonic(), result)
+        return result
 
     def _read_file(self, path: str) -> str:
         if not path.strip():
             return LABEL_NA
+        expanded = _expand_path(path.strip())
         try:
-            return _expand_path(path.strip()).read_text(encoding="utf-8").strip()
+            st = expanded.stat()
+            with _file_value_cache_lock:
+                cached = _file_value_cache.get(expanded)
+                if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                    return cached[2]
+            text = expanded.read_text(encoding="utf-8").strip()
         except OSError:
             return LABEL_NA
+        with _file_value_cache_lock:
+            _file_value_cache[expanded] = (st.st_mtime_ns, st.st_size, text)
+        return text
 
 
 class SliderRow(SliderMonitorMixin, BaseActionRow):
@@ -2024,9 +2085,9 @@ class SelectionRow(DynamicIconMixin, HyprlandIPCMixin, Adw.ComboRow):
         self._options_fetch_generation = 0
 
         title = str(properties.get("title", "Unnamed"))
-        self.set_title(GLib.markup_escape_text(title))
+        self.set_title(_escape_markup(title))
         if sub := properties.get("description", ""):
-            self.set_subtitle(GLib.markup_escape_text(str(sub)))
+            self.set_subtitle(_escape_markup(str(sub)))
 
         icon_config = properties.get("icon", DEFAULT_ICON)
         self.icon_widget = self._create_icon_widget(icon_config)
@@ -2072,18 +2133,7 @@ class SelectionRow(DynamicIconMixin, HyprlandIPCMixin, Adw.ComboRow):
                 self._queue_options_fetch()
 
     def _create_icon_widget(self, icon: object) -> Gtk.Image:
-        if isinstance(icon, dict) and icon.get("type") == "file":
-            if path := icon.get("path"):
-                p = _expand_path(str(path))
-                if p.exists():
-                    img = Gtk.Image.new_from_file(str(p))
-                    img.add_css_class("action-row-prefix-icon")
-                    return img
-
-        icon_name = _resolve_static_icon_name(icon)
-        img = Gtk.Image.new_from_icon_name(icon_name)
-        img.add_css_class("action-row-prefix-icon")
-        return img
+        return _prefix_icon(icon)
 
     @contextmanager
     def _suppress_change_signal(self):
@@ -2348,7 +2398,7 @@ class EntryRow(DynamicIconMixin, HyprlandIPCMixin, Adw.EntryRow):
         self.toast_overlay: Adw.ToastOverlay | None = self.context.get("toast_overlay")
 
         title = str(properties.get("title", "Unnamed"))
-        self.set_title(GLib.markup_escape_text(title))
+        self.set_title(_escape_markup(title))
 
         icon_config = properties.get("icon", DEFAULT_ICON)
         self.icon_widget = self._create_icon_widget(icon_config)
@@ -2368,18 +2418,7 @@ class EntryRow(DynamicIconMixin, HyprlandIPCMixin, Adw.EntryRow):
         self._start_hyprland_ipc()
 
     def _create_icon_widget(self, icon: object) -> Gtk.Image:
-        if isinstance(icon, dict) and icon.get("type") == "file":
-            if path := icon.get("path"):
-                p = _expand_path(str(path))
-                if p.exists():
-                    img = Gtk.Image.new_from_file(str(p))
-                    img.add_css_class("action-row-prefix-icon")
-                    return img
-
-        icon_name = _resolve_static_icon_name(icon)
-        img = Gtk.Image.new_from_icon_name(icon_name)
-        img.add_css_class("action-row-prefix-icon")
-        return img
+        return _prefix_icon(icon)
 
     def _on_apply(self, _btn: Gtk.Button) -> None:
         text = self.get_text()
@@ -2418,7 +2457,7 @@ class NavigationRow(BaseActionRow):
     ) -> None:
         super().__init__(properties, None, context)
         self.layout_data: list[object] = layout_data or []
-        self.add_suffix(Gtk.Image.new_from_icon_name("go-next-symbolic"))
+        self.add_suffix(_themed_image("go-next-symbolic"))
         self.set_activatable(True)
         self.connect("activated", self._on_activated)
 
@@ -2452,9 +2491,9 @@ class ExpanderRow(DynamicIconMixin, HyprlandIPCMixin, Adw.ExpanderRow):
         self.builder_func = self.context.get("builder_func")
 
         title = str(properties.get("title", "Expander"))
-        self.set_title(GLib.markup_escape_text(title))
+        self.set_title(_escape_markup(title))
         if sub := properties.get("description", ""):
-            self.set_subtitle(GLib.markup_escape_text(str(sub)))
+            self.set_subtitle(_escape_markup(str(sub)))
 
         icon_config = properties.get("icon", DEFAULT_ICON)
         self.icon_widget = self._create_icon_widget(icon_config)
@@ -2468,17 +2507,7 @@ class ExpanderRow(DynamicIconMixin, HyprlandIPCMixin, Adw.ExpanderRow):
         self._start_hyprland_ipc()
 
     def _create_icon_widget(self, icon: object) -> Gtk.Image:
-        if isinstance(icon, dict) and icon.get("type") == "file":
-            if path := icon.get("path"):
-                p = _expand_path(str(path))
-                if p.exists():
-                    img = Gtk.Image.new_from_file(str(p))
-                    img.add_css_class("action-row-prefix-icon")
-                    return img
-        icon_name = _resolve_static_icon_name(icon)
-        img = Gtk.Image.new_from_icon_name(icon_name)
-        img.add_css_class("action-row-prefix-icon")
-        return img
+        return _prefix_icon(icon)
 
     def _build_child_rows(self) -> None:
         for item in self.items_data:
@@ -2578,7 +2607,7 @@ class FlagGroupRow(DynamicIconMixin, HyprlandIPCMixin, Adw.PreferencesRow):
 
         title_str = str(properties.get("title", "Unnamed"))
         title_label = Gtk.Label(xalign=0)
-        title_label.set_markup(f"<b>{GLib.markup_escape_text(title_str)}</b>")
+        title_label.set_markup(f"<b>{_escape_markup(title_str)}</b>")
         title_label.set_wrap(True)
         text_box.append(title_label)
 
@@ -2645,18 +2674,7 @@ class FlagGroupRow(DynamicIconMixin, HyprlandIPCMixin, Adw.PreferencesRow):
         self._start_hyprland_ipc()
 
     def _create_icon_widget(self, icon: object) -> Gtk.Image:
-        if isinstance(icon, dict) and icon.get("type") == "file":
-            if path := icon.get("path"):
-                p = _expand_path(str(path))
-                if p.exists():
-                    img = Gtk.Image.new_from_file(str(p))
-                    img.add_css_class("action-row-prefix-icon")
-                    return img
-
-        icon_name = _resolve_static_icon_name(icon)
-        img = Gtk.Image.new_from_icon_name(icon_name)
-        img.add_css_class("action-row-prefix-icon")
-        return img
+        return _prefix_icon(icon)
 
     def _on_action_clicked(self, _btn: Gtk.Button) -> None:
         active_flags = [self._flag_map[chk] for chk in self.check_buttons if chk.get_active()]
@@ -2742,7 +2760,7 @@ class AsyncSelectorRow(DynamicIconMixin, HyprlandIPCMixin, Adw.PreferencesRow):
 
         title_str = str(properties.get("title", "Unnamed"))
         title_label = Gtk.Label(xalign=0)
-        title_label.set_markup(f"<b>{GLib.markup_escape_text(title_str)}</b>")
+        title_label.set_markup(f"<b>{_escape_markup(title_str)}</b>")
         title_label.set_wrap(True)
         text_box.append(title_label)
 
@@ -2817,18 +2835,7 @@ class AsyncSelectorRow(DynamicIconMixin, HyprlandIPCMixin, Adw.PreferencesRow):
             self._on_refresh_clicked(self.refresh_btn)
 
     def _create_icon_widget(self, icon: object) -> Gtk.Image:
-        if isinstance(icon, dict) and icon.get("type") == "file":
-            if path := icon.get("path"):
-                p = _expand_path(str(path))
-                if p.exists():
-                    img = Gtk.Image.new_from_file(str(p))
-                    img.add_css_class("action-row-prefix-icon")
-                    return img
-
-        icon_name = _resolve_static_icon_name(icon)
-        img = Gtk.Image.new_from_icon_name(icon_name)
-        img.add_css_class("action-row-prefix-icon")
-        return img
+        return _prefix_icon(icon)
 
     @contextmanager
     def _suppress_change_signal(self):
@@ -3139,7 +3146,7 @@ class GridCardBase(Gtk.Button):
         box.set_valign(Gtk.Align.CENTER)
         box.set_halign(Gtk.Align.CENTER)
 
-        img = Gtk.Image.new_from_icon_name(icon)
+        img = _themed_image(icon)
         img.set_pixel_size(ICON_PIXEL_SIZE)
         img.add_css_class("hero-icon")
         self.icon_widget = img
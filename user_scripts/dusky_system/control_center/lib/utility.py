@@ -7,6 +7,8 @@ Persisted settings use an atomic batched buffer. Public helpers are thread-safe.
 from __future__ import annotations
 
 import atexit
+import functools
+import importlib.util
 import logging
 import os
 import re
@@ -37,6 +39,7 @@ __all__ = [
     "load_config",
     "load_setting",
     "preflight_check",
+    "preload_settings",
     "register_toast_overlay",
     "save_setting",
     "toast",
@@ -149,7 +152,29 @@ def get_cache_dir() -> Path:
 # =============================================================================
 # CONFIGURATION LOADER
 # =============================================================================
+_config_cache_lock: Final[threading.Lock] = threading.Lock()
+_config_cache: dict[Path, tuple[int, int, dict[str, object]]] = {}
+
+
 def load_config(config_path: Path) -> dict[str, object]:
+    """Load a TOML config, skipping the re-read/re-parse when the file is unchanged.
+
+    Parsed results are cached per path and invalidated on (mtime_ns, size), so
+    hot reloads of an untouched file cost one stat() instead of a full parse.
+    The cached dict is returned directly; callers that need rollback safety
+    already deep-copy (see the hot-reload path in the main controller).
+    """
+    try:
+        st = config_path.stat()
+    except OSError as e:
+        log.warning("Config file unreadable: %s (%s)", config_path, e)
+        return {}
+
+    with _config_cache_lock:
+        cached = _config_cache.get(config_path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
     try:
         content = config_path.read_text(encoding="utf-8")
     except (FileNotFoundError, OSError) as e:
@@ -162,7 +187,12 @@ def load_config(config_path: Path) -> dict[str, object]:
         log.error("TOML syntax error in %s: %s", config_path, e)
         return {}
 
-    return data if isinstance(data, dict) else {}
+    if not isinstance(data, dict):
+        return {}
+
+    with _config_cache_lock:
+        _config_cache[config_path] = (st.st_mtime_ns, st.st_size, data)
+    return data
 
 
 # =============================================================================
@@ -174,16 +204,17 @@ def execute_command(
     run_in_terminal: bool,
     requires_root: bool = False
 ) -> bool:
-    normalized_cmd = _normalize_command(cmd_string)
-    if not normalized_cmd:
-        return False
-
-    safe_title = _sanitize_title(title)
-    full_cmd = _build_command_list(normalized_cmd, safe_title, run_in_terminal, requires_root)
-
-    if full_cmd is None:
+    # Commands and titles come verbatim from the config, so the same inputs
+    # recur on every click; memoizing skips re-normalizing, re-sanitizing,
+    # and re-parsing with shlex in the UI-thread callback.
+    cached_cmd = _resolve_command(cmd_string, title, run_in_terminal, requires_root)
+    if cached_cmd is None:
         log.error("Failed to parse command: %r", cmd_string)
         return False
+    if not cached_cmd:
+        return False
+
+    full_cmd = list(cached_cmd)
 
     if run_in_terminal:
         if shutil.which("kitty") is None:
@@ -209,6 +240,28 @@ def execute_command(
         return False
 
 
+@functools.lru_cache(maxsize=256)
+def _resolve_command(
+    cmd_string: str,
+    title: str,
+    run_in_terminal: bool,
+    requires_root: bool,
+) -> tuple[str, ...] | None:
+    """
+    Resolve a config command string into its final argv, memoized.
+
+    Returns an empty tuple for a blank command and None when parsing fails;
+    callers receive a tuple so the cached value stays immutable.
+    """
+    normalized_cmd = _normalize_command(cmd_string)
+    if not normalized_cmd:
+        return ()
+
+    safe_title = _sanitize_title(title)
+    full_cmd = _build_command_list(normalized_cmd, safe_title, run_in_terminal, requires_root)
+    return None if full_cmd is None else tuple(full_cmd)
+
+
 def _normalize_command(cmd_string: str) -> str:
     cmd = cmd_string.strip()
     home_dir = str(Path.home())
@@ -315,12 +368,18 @@ def _build_command_list(
 def preflight_check() -> None:
     missing_deps: list[str] = []
 
-    try:
-        import gi
-        gi.require_version("Gtk", "4.0")
-        gi.require_version("Adw", "1")
-    except (ImportError, ValueError):
+    # Probe availability with find_spec first so a missing binding is detected
+    # without paying for module initialization; the version check below only
+    # runs when the import is going to happen anyway in the main module.
+    if importlib.util.find_spec("gi") is None:
         missing_deps.append("python-gobject (GTK4/Libadwaita)")
+    else:
+        try:
+            import gi
+            gi.require_version("Gtk", "4.0")
+            gi.require_version("Adw", "1")
+        except (ImportError, ValueError):
+            missing_deps.append("python-gobject (GTK4/Libadwaita)")
 
     if missing_deps:
         msg = "FATAL: Dusky Control Center missing dependencies:\n" + "\n".join(f"  - {dep}" for dep in missing_deps)
@@ -552,6 +611,42 @@ def save_setting(key: str, value: bool | int | float | str) -> bool:
     return _SettingsWriteBuffer().queue_write(key, str(value))
 
 
+# Per-file read cache guarded by (mtime_ns, size) so external edits are
+# still picked up with a single stat instead of a full read per call.
+_setting_read_cache: dict[Path, tuple[int, int, str]] = {}
+_setting_read_cache_lock = threading.Lock()
+
+
+def preload_settings() -> int:
+    """
+    Warm the settings read cache with one directory walk.
+
+    Settings live as one small file per key, so building N toggle rows
+    otherwise costs N serial open/read round trips. Calling this once
+    before page construction turns those into cache hits.
+
+    Returns:
+        Number of setting files loaded into the cache.
+    """
+    base = _settings_dir_cache.get()
+    loaded = 0
+    for root, _dirs, files in os.walk(base):
+        root_path = Path(root)
+        for name in files:
+            if name.startswith("."):
+                continue
+            target = root_path / name
+            try:
+                st = target.stat()
+                raw = target.read_text(encoding="utf-8").strip()
+            except OSError:
+                continue
+            with _setting_read_cache_lock:
+                _setting_read_cache[target] = (st.st_mtime_ns, st.st_size, raw)
+            loaded += 1
+    return loaded
+
+
 @overload
 def load_setting(key: str, default: bool) -> bool: ...
 
@@ -582,11 +677,24 @@ def load_setting(
             raw = buffer_inst._buffer[target]
             return _coerce_type(raw, default)
 
+    try:
+        st = target.stat()
+    except OSError:
+        return default
+
+    with _setting_read_cache_lock:
+        cached = _setting_read_cache.get(target)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return _coerce_type(cached[2], default)
+
     try:
         raw = target.read_text(encoding="utf-8").strip()
     except (FileNotFoundError, OSError):
         return default
 
+    with _setting_read_cache_lock:
+        _setting_read_cache[target] = (st.st_mtime_ns, st.st_size, raw)
+
     return _coerce_type(raw, default)
 
 
@@ -18,6 +18,7 @@ import re
 import shlex
 import shutil
 import signal
+import socket
 import subprocess
 import sys
 import tempfile
@@ -31,6 +32,7 @@ from typing import Any, Final
 
 APP_ID: Final = "org.dusky.quickpanal"
 HOME: Final = os.path.expanduser("~")
+UID: Final = os.getuid()
 
 if not logging.getLogger().handlers:
     logging.basicConfig(level=logging.WARNING, format=f"{APP_ID}: %(levelname)s: %(message)s")
@@ -205,8 +207,8 @@ def _resolve_state_dir() -> Path | None:
     if (xdg_state := os.environ.get("XDG_STATE_HOME")): candidates.append(Path(xdg_state) / APP_ID)
     candidates.append(Path.home() / ".local" / "state" / APP_ID)
     if (xdg_runtime := os.environ.get("XDG_RUNTIME_DIR")): candidates.append(Path(xdg_runtime) / APP_ID)
-    candidates.append(Path(f"/run/user/{os.getuid()}") / APP_ID)
-    candidates.append(Path(tempfile.gettempdir()) / f"{APP_ID}-{os.getuid()}")
+    candidates.append(Path(f"/run/user/{UID}") / APP_ID)
+    candidates.append(Path(tempfile.gettempdir()) / f"{APP_ID}-{UID}")
 
     for path in candidates:
         try: path.mkdir(mode=0o700, parents=True, exist_ok=True)
@@ -219,13 +221,18 @@ STATE_FILE: Final = None if STATE_DIR is None else STATE_DIR / "hyprsunset_state
 DDCUTIL_CACHE_FILE: Final = None if STATE_DIR is None else STATE_DIR / "ddcutil_displays.json"
 
 def atomic_write_text(path: Path, text: str, *, durable: bool = True) -> bool:
+    # Fixed per-target temp name: every target here has exactly one writer
+    # at a time (debounced/worker-serialized), so mkstemp's exclusive
+    # random-name loop only added syscalls per write.
     try:
         path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
-        fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", text=True)
-        with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as handle:
-            handle.write(text)
-            handle.flush()
-            if durable: os.fsync(handle.fileno())
+        temp_path = os.fspath(path.with_name(f".{path.name}.tmp"))
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            os.write(fd, text.encode("utf-8"))
+            if durable: os.fsync(fd)
+        finally:
+            os.close(fd)
         os.replace(temp_path, path)
         if durable:
             try:
@@ -461,21 +468,41 @@ def fetch_notifications() -> list[NotificationData]:
 # ==============================================================================
 # HARDWARE CONTROL
 # ==============================================================================
+# Last observed sink mute state; lets apply_volume skip the unmute spawn
+# when the sink is already known to be unmuted (one wpctl per drag tick
+# instead of two). None means unknown, so the unmute is sent to be safe.
+_sink_muted: bool | None = None
+
+# Short-lived read cache so the 2s live-refresh tick and a re-presented
+# window don't each fork wpctl; writes invalidate it.
+_VOLUME_CACHE_TTL_SECONDS: Final = 2.0
+_volume_cache: tuple[float, float] | None = None
+
 def get_volume() -> float | None:
+    global _sink_muted, _volume_cache
     if WPCTL is None: return None
+    cached = _volume_cache
+    if cached is not None and time.monotonic() < cached[0]: return cached[1]
     r = run_command([WPCTL, "get-volume", "@DEFAULT_AUDIO_SINK@"], timeout=QUERY_TIMEOUT, capture_stdout=True)
     if r is None or r.returncode != 0: return None
     parts = r.stdout.split()
     if len(parts) < 2: return None
+    _sink_muted = "[MUTED]" in r.stdout
     val = parse_float(parts[1])
-    return clamp(val * 100.0, 0.0, 100.0) if val is not None else None
+    if val is None: return None
+    value = clamp(val * 100.0, 0.0, 100.0)
+    _volume_cache = (time.monotonic() + _VOLUME_CACHE_TTL_SECONDS, value)
+    return value
 
 def apply_volume(value: float) -> None:
+    global _sink_muted, _volume_cache
     if WPCTL is None: return
+    _volume_cache = None
     vol = percent_int(value)
     r = run_command([WPCTL, "set-volume", "@DEFAULT_AUDIO_SINK@", f"{vol}%"], timeout=CONTROL_TIMEOUT)
-    if r is not None and r.returncode == 0 and vol > 0:
-        run_command([WPCTL, "set-mute", "@DEFAULT_AUDIO_SINK@", "0"], timeout=CONTROL_TIMEOUT)
+    if r is not None and r.returncode == 0 and vol > 0 and _sink_muted is not False:
+        r = run_command([WPCTL, "set-mute", "@DEFAULT_AUDIO_SINK@", "0"], timeout=CONTROL_TIMEOUT)
+        if r is not None and r.returncode == 0: _sink_muted = False
 
 # --- Sysfs Backlight & Hardware Brightness Controls ---
 @dataclass(frozen=True, slots=True)
@@ -844,6 +871,33 @@ def apply_local_brightness(value: float) -> None:
     if (base_cmd := _brightnessctl_command_base()) is None: return
     run_command([*base_cmd, "--quiet", "set", f"{brightness}%"], timeout=CONTROL_TIMEOUT)
 
+def _hyprland_control_socket() -> Path | None:
+    signature = os.environ.get("HYPRLAND_INSTANCE_SIGNATURE")
+    if not signature: return None
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or f"/run/user/{UID}"
+    path = Path(runtime_dir) / "hypr" / signature / ".socket.sock"
+    return path if path.is_socket() else None
+
+def hyprctl_request(request: str, *, timeout: float) -> str | None:
+    """
+    Send one request over Hyprland's control socket the way hyprctl does,
+    without the fork/exec. Hyprland closes the connection after replying,
+    so each request is its own short-lived connect.
+    """
+    path = _hyprland_control_socket()
+    if path is None: return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(os.fspath(path))
+            sock.sendall(request.encode("utf-8"))
+            chunks: list[bytes] = []
+            while chunk := sock.recv(4096):
+                chunks.append(chunk)
+    except OSError:
+        return None
+    return b"".join(chunks).decode("utf-8", errors="replace")
+
 def get_hyprsunset_state() -> float:
     if STATE_FILE is None: return DEFAULT_SUNSET
     try: value = parse_float(STATE_FILE.read_text(encoding="utf-8"))
@@ -851,15 +905,18 @@ def get_hyprsunset_state() -> float:
     if value is None: return DEFAULT_SUNSET
     return clamp(value, 1000.0, 6000.0)
 
-def write_hyprsunset_state(value: float) -> None:
+def write_hyprsunset_state(value: float, *, durable: bool = True) -> None:
     if STATE_FILE is not None:
-        atomic_write_text(STATE_FILE, f"{kelvin_value(value)}\n", durable=True)
+        atomic_write_text(STATE_FILE, f"{kelvin_value(value)}\n", durable=durable)
 
 class HyprsunsetController:
-    __slots__ = ("_fallback_process", "_process_lock", "_ready", "_state_writer", "_worker")
+    __slots__ = ("_fallback_process", "_last_applied", "_process_lock", "_ready", "_state_writer", "_worker")
 
     def __init__(self) -> None:
-        self._state_writer = DebouncedValueWriter("sunset-state", write_hyprsunset_state, delay_seconds=SUNSET_STATE_WRITE_DEBOUNCE_SECONDS)
+        # Debounced writes skip fsync: the file only mirrors slider position,
+        # and the rename keeps old-or-new semantics. stop() writes durably.
+        self._state_writer = DebouncedValueWriter("sunset-state", lambda value: write_hyprsunset_state(value, durable=False), delay_seconds=SUNSET_STATE_WRITE_DEBOUNCE_SECONDS)
+        self._last_applied: float | None = None
         self._worker = LatestValueWorker("sunset", self._apply)
         self._ready = threading.Event()
         self._process_lock = threading.Lock()
@@ -874,6 +931,8 @@ class HyprsunsetController:
     def stop(self, timeout: float = 3.0) -> None:
         self._worker.stop(timeout)
         self._state_writer.stop(timeout)
+        if (last := self._last_applied) is not None:
+            write_hyprsunset_state(last, durable=True)
 
     def _apply(self, value: float) -> None:
         target = kelvin_value(value)
@@ -888,6 +947,7 @@ class HyprsunsetController:
 
     def _mark_applied(self, target: int) -> None:
         self._ready.set()
+        self._last_applied = float(target)
         self._state_writer.schedule(float(target))
 
     def _wait_until_applied(self, target: int, timeout: float) -> bool:
@@ -900,6 +960,8 @@ class HyprsunsetController:
         return False
 
     def _send_temperature(self, target: int) -> bool:
+        reply = hyprctl_request(f"/hyprsunset temperature {target}", timeout=QUERY_TIMEOUT)
+        if reply is not None: return reply.strip().lower() == "ok"
         if HYPRCTL is None: return False
         result = run_command([HYPRCTL, "hyprsunset", "temperature", str(target)], timeout=QUERY_TIMEOUT)
         return result is not None and result.returncode == 0
@@ -916,7 +978,7 @@ class HyprsunsetController:
             proc = self._fallback_process
             if proc is not None and proc.poll() is None: return True
         if PGREP is None: return False
-        result = run_command([PGREP, "-u", str(os.getuid()), "-x", "hyprsunset"], timeout=QUERY_TIMEOUT)
+        result = run_command([PGREP, "-u", str(UID), "-x", "hyprsunset"], timeout=QUERY_TIMEOUT)
         return result is not None and result.returncode == 0
 
     def _spawn_fallback_process(self, target: int) -> None:
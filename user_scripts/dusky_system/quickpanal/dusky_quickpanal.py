@@ -51,7 +51,7 @@ from dusky_backend import (
 )
 
 from dusky_ui import (
-    CSS, _add_css_class, _remove_css_class,
+    CSS_BYTES, _add_css_class, _remove_css_class,
     QuickIconToggle, MetricPill, CompactSliderRow, NotificationsPanel
 )
 
@@ -742,6 +742,17 @@ class QuickPanalApp(Gtk.Application):
     def __init__(self):
         super().__init__(application_id=APP_ID, flags=Gio.ApplicationFlags.FLAGS_NONE)
         self.window, self.pool, self._volume_worker, self._local_brightness_worker, self._sunset_controller = None, None, None, None, None
+        # Overlap config I/O (and first-run file creation) with GTK's own
+        # startup work; do_startup joins before the window is built.
+        self._config_result: dict | None = None
+        self._config_thread = threading.Thread(target=self._load_config_worker, daemon=True)
+        self._config_thread.start()
+
+    def _load_config_worker(self):
+        try:
+            self._config_result = load_or_create_config()
+        except Exception:
+            LOG.exception("Background config load failed")
 
     def submit_volume(self, value: float):
         if self._volume_worker: self._volume_worker.submit(value)
@@ -773,7 +784,8 @@ class QuickPanalApp(Gtk.Application):
         GLibUnix.signal_add(GLib.PRIORITY_DEFAULT, signal.SIGTERM, lambda *_: self.quit() or GLib.SOURCE_REMOVE)
         self.hold()
 
-        config_data = load_or_create_config()
+        self._config_thread.join()
+        config_data = self._config_result if self._config_result is not None else tomllib.loads(DEFAULT_TOML_CONFIG)
 
         if DDC_MANAGER: DDC_MANAGER.start()
 
@@ -785,13 +797,8 @@ class QuickPanalApp(Gtk.Application):
         settings = Gtk.Settings.get_default()
         if settings: settings.set_property("gtk-application-prefer-dark-theme", True)
         
-        # Inject custom compact switch styling on top of the imported CSS
         provider = Gtk.CssProvider()
-        extended_css = CSS + """
-        switch.compact-switch { min-width: 38px; min-height: 20px; }
-        switch.compact-switch slider { min-width: 18px; min-height: 18px; }
-        """
-        provider.load_from_data(extended_css.encode("utf-8"))
+        provider.load_from_data(CSS_BYTES)
         Gtk.StyleContext.add_provider_for_screen(Gdk.Screen.get_default(), provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
 
         self.window = QuickPanalWindow(self, self.pool, config_data,
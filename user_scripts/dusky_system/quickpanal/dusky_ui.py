@@ -13,6 +13,8 @@ from concurrent.futures import Future, CancelledError
 from pathlib import Path
 from typing import Any, Callable
 
+from functools import lru_cache
+
 import gi
 gi.require_version("Gtk", "3.0")
 gi.require_version("Gdk", "3.0")
@@ -30,6 +32,14 @@ def _add_css_class(widget: Gtk.Widget, cls: str) -> None:
 def _remove_css_class(widget: Gtk.Widget, cls: str) -> None:
     widget.get_style_context().remove_class(cls)
 
+_RE_MARKUP_TAG = re.compile(r'<[^>]+>')
+
+@lru_cache(maxsize=256)
+def _clean_notification_body(body: str) -> str:
+    """Strip markup tags and newlines; memoized since the same bodies are
+    re-rendered on every notification refresh."""
+    return _RE_MARKUP_TAG.sub('', body).replace('\n', ' ').strip()
+
 class QuickIconToggle(Gtk.Overlay):
     def __init__(self, icon_name: str, tooltip: str, on_left: str = "", on_middle: str = "", on_right: str = ""):
         super().__init__()
@@ -133,6 +143,9 @@ class CompactSliderRow(Gtk.Box):
         self._suppress_apply, self._has_value = False, False
         self._post_submit_refresh_grace_seconds = max(0.0, post_submit_refresh_grace_seconds)
         self._pending_local_value, self._pending_local_deadline = None, 0.0
+        # Last value the hardware is known to hold (committed or refreshed);
+        # sub-step drag motion snaps to the same value and is skipped.
+        self._last_committed: float | None = None
 
         _add_css_class(self, "slider-row")
         self.icon = Gtk.Label(label=icon_text)
@@ -210,6 +223,7 @@ class CompactSliderRow(Gtk.Box):
             self.value_label.set_label(str(int(round(clamped))))
             self.scale.set_sensitive(True)
             self._has_value = True
+            self._last_committed = clamped
         finally:
             self._suppress_apply = False
         return GLib.SOURCE_REMOVE
@@ -224,6 +238,7 @@ class CompactSliderRow(Gtk.Box):
 
         self.value_label.set_label(str(int(round(snapped))))
         if self._suppress_apply: return
+        if self._last_committed is not None and math.isclose(snapped, self._last_committed, rel_tol=0.0, abs_tol=1e-9): return
 
         if self._post_submit_refresh_grace_seconds > 0.0:
             self._pending_local_value = snapped
@@ -231,6 +246,7 @@ class CompactSliderRow(Gtk.Box):
         else:
             self._pending_local_value = None
 
+        self._last_committed = snapped
         self._user_revision += 1
         self._submit_cb(snapped)
 
@@ -269,7 +285,7 @@ class NotificationRow(Gtk.ListBoxRow):
 
         # Body
         if notif.body:
-            clean_body = re.sub(r'<[^>]+>', '', notif.body).replace('\n', ' ').strip()
+            clean_body = _clean_notification_body(notif.body)
             if clean_body:
                 body_lbl = Gtk.Label(label=clean_body)
                 body_lbl.set_halign(Gtk.Align.START)
@@ -761,4 +777,12 @@ button.notif-close-btn:hover { background-color: alpha(#ff453a, 0.2); color: #ff
     border-bottom-left-radius: 24px;
     border-bottom-right-radius: 24px;
 }
+
+/* Compact switch sizing (used by the wifi/bluetooth header switches) */
+switch.compact-switch { min-width: 38px; min-height: 20px; }
+switch.compact-switch slider { min-width: 18px; min-height: 18px; }
 """
+
+# Encoded once at import so do_startup hands GTK the finished byte blob
+# instead of concatenating and re-encoding the stylesheet per launch.
+CSS_BYTES = CSS.encode("utf-8")
@@ -81,6 +81,12 @@ def get_xdg_config_home() -> Path:
 
 CONFIG_DIR = get_xdg_config_home() / "dusky_sites"
 
+# Swatch-rendering regexes, compiled once at import: render_menu_item runs
+# them for every row on every menu redraw.
+_RE_VAR_REF = re.compile(r'var\((--[\w-]+)\)')
+_RE_RGB_TRIPLE = re.compile(r'rgba\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)')
+_RE_CSS_DECL = re.compile(r'(--[a-zA-Z0-9_-]+):\s*([^;{}]+?)\s*;')
+
 # =============================================================================
 # ▼ LIVE MATUGEN PARSER (DYNAMIC MTIME POLLING) ▼
 # =============================================================================
@@ -102,7 +108,7 @@ class ColorTracker:
             current_mtime = self.path.stat().st_mtime
             if current_mtime != self.last_mtime:
                 content = self.path.read_text(encoding="utf-8")
-                matches = re.findall(r'(--[a-zA-Z0-9_-]+):\s*([^;{}]+?)\s*;', content)
+                matches = _RE_CSS_DECL.findall(content)
                 self.colors = {k: v for k, v in matches}
                 self.last_mtime = current_mtime
         except (OSError, UnicodeDecodeError):
@@ -500,7 +506,7 @@ def render_menu_item(data_dict: dict[str, str]) -> str:
     swatch = "[dim]  [/dim]"
     var_name = ""
     
-    match = re.search(r'var\((--[\w-]+)\)', var_string)
+    match = _RE_VAR_REF.search(var_string)
     if match:
         var_name = match.group(1)
         hex_val = live_color_tracker.get_colors().get(var_name)
@@ -510,7 +516,7 @@ def render_menu_item(data_dict: dict[str, str]) -> str:
                 swatch = f"[{safe_hex}]██[/]"
             elif hex_val.startswith('rgba'):
                 # Extract pure RGB from RGBA to safely display in Rich and prevent StyleSyntaxError crashes
-                rgba_match = re.search(r'rgba\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)', hex_val)
+                rgba_match = _RE_RGB_TRIPLE.search(hex_val)
                 if rgba_match:
                     r, g, b = rgba_match.groups()
                     swatch = f"[rgb({r},{g},{b})]██[/]"
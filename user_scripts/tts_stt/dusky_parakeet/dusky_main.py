@@ -209,14 +209,21 @@ class VADProcessor:
                 "https://raw.githubusercontent.com/snakers4/silero-vad/master/files/silero_vad.onnx",
             ]
             for url in urls:
+                temp_path = self.model_path.with_suffix(".onnx.part")
                 try:
                     import urllib.request
                     logger.info(f"Trying VAD download {url}")
-                    urllib.request.urlretrieve(url, str(self.model_path))
+                    # Stream to a temp file and rename only on success, so an
+                    # interrupted download can't leave a truncated model that
+                    # exists() would treat as complete on the next start.
+                    with urllib.request.urlopen(url, timeout=60) as resp, open(temp_path, "wb") as f:
+                        shutil.copyfileobj(resp, f, length=1024 * 1024)
+                    os.replace(temp_path, self.model_path)
                     logger.info(f"Downloaded VAD to {self.model_path}")
                     break
                 except Exception as e:
                     logger.warning(f"VAD download failed {url}: {e}")
+                    temp_path.unlink(missing_ok=True)
                     continue
             else:
                 self.model_path = None
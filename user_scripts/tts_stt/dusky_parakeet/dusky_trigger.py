@@ -43,8 +43,10 @@ def is_running() -> bool:
         return False
     try:
         pid = int(PID_FILE.read_text().strip())
-        os.kill(pid, 0)
-        return True
+        # Check /proc comm instead of os.kill(pid, 0): a stale pid file
+        # pointing at a recycled PID would otherwise look alive.
+        comm = Path(f"/proc/{pid}/comm").read_text().strip()
+        return comm.startswith("python")
     except Exception:
         return False
 
@@ -1366,6 +1366,8 @@ class Visualizer:
         self.cava_proc: subprocess.Popen[bytes] | None = None
         self.cava_watch: int | None = None
         self.cava_buffer = b""
+        self.cava_last_frame: tuple[bytes, float] | None = None
+        self.cava_last_active = False
         self.cava_fail_count = 0
         self.cava_restart_source: int | None = None
         self.cava_available = shutil.which("cava") is not None
@@ -1890,6 +1892,12 @@ ignore = 0
 noise_reduction = {noise}
 """
 
+        try:
+            if CAVA_CONF_FILE.read_text(encoding="utf-8") == text:
+                return CAVA_CONF_FILE
+        except OSError:
+            pass
+
         atomic_write_text(CAVA_CONF_FILE, text)
         return CAVA_CONF_FILE
 
@@ -1986,6 +1994,8 @@ noise_reduction = {noise}
             self.cava_proc = None
 
         self.cava_buffer = b""
+        self.cava_last_frame = None
+        self.cava_last_active = False
 
     def schedule_cava_restart(self) -> None:
         if not self.config.enabled:
@@ -2031,18 +2041,28 @@ noise_reduction = {noise}
             if len(self.cava_buffer) > 1_048_576:
                 self.cava_buffer = b""
 
-            if b"\n" not in self.cava_buffer:
+            last_nl = self.cava_buffer.rfind(b"\n")
+            if last_nl < 0:
                 return True
 
-            *lines, remainder = self.cava_buffer.split(b"\n")
-            self.cava_buffer = remainder
+            # Use only the newest complete frame: slice it out directly
+            # instead of splitting the whole buffer into lines we discard.
+            prev_nl = self.cava_buffer.rfind(b"\n", 0, last_nl)
+            line = self.cava_buffer[prev_nl + 1 : last_nl].strip()
+            self.cava_buffer = self.cava_buffer[last_nl + 1 :]
 
-            if not lines:
+            if not line:
                 return True
 
-            # Use only the newest complete frame.
-            line = lines[-1].strip()
-            if not line:
+            gain = self.config.gain
+
+            # Consecutive identical frames (held peaks, silence) parse to the
+            # same values; just keep the render tick alive and skip the work.
+            if self.cava_last_frame == (line, gain):
+                self.cava_fail_count = 0
+                if self.cava_last_active:
+                    self.has_rendered_idle_clear = False
+                    self.ensure_tick()
                 return True
 
             parts = line.split(b";")
@@ -2053,7 +2073,6 @@ noise_reduction = {noise}
             if len(parts) != bars:
                 return True
 
-            gain = self.config.gain
             out = self.cava_shared_data
 
             if len(out) != bars:
@@ -2079,6 +2098,8 @@ noise_reduction = {noise}
                 if value > 0.001:
                     active = True
 
+            self.cava_last_frame = (line, gain)
+            self.cava_last_active = active
             self.cava_fail_count = 0
 
             if active: